@@ -1,15 +1,16 @@
 import pathlib
 import os
-import pickle
-from typing import Iterable
+import threading
+from collections.abc import Iterable
 import warnings
-from multiprocessing import Pool
-from multiprocessing.pool import ThreadPool
-from copy import deepcopy
 
-from minio import Minio
+# minio, multiprocessing and pickle are imported on first use to keep `import easy_minio` fast.
 
-from .utils import infer_format, get_bucket_and_prefix, create_parent_folder_if_not_exists, is_path
+from .utils import infer_format, get_bucket_and_prefix, create_parent_folder_if_not_exists, is_path, \
+    link_or_copy_file, move_file, break_hardlink
+
+# Maximum number of keys accepted by a single multi-object delete request.
+MAX_DELETE_OBJECTS = 1000
 
 
 class Open:
@@ -28,6 +29,9 @@ class Open:
                 "on file '{}', reading or appending with refresh=False, the file may be stale".format(file_path))
         if version_id is not None and "r" not in mode:
             raise ValueError()
+        if "w" in mode and self.cache_file_path.is_file():
+            # The file is truncated anyway, unlinking it also detaches it from hardlinked copies.
+            os.remove(str(self.cache_file_path))
         if "r" in mode:
             self.easy_client.get_object_cache(
                 file_path, refresh=refresh, version_id=version_id)
@@ -35,6 +39,7 @@ class Open:
             if self.easy_client.object_exists(file_path):
                 self.easy_client.get_object_cache(
                     file_path, refresh=refresh, version_id=version_id)
+            break_hardlink(self.cache_file_path)
 
     def __enter__(self):
         self.file = open(str(self.cache_file_path), self.mode)
@@ -45,21 +50,30 @@ class Open:
         self.easy_client._client.fput_object(
             self.bucket, self.prefix, str(self.cache_file_path))
 
+
+# Clients created in pool workers, reused by all tasks the worker runs.
+_worker_clients = {}
+
+
+def get_worker_client(args):
+    key = (args["endpoint"], args["access_key"], args["secret_key"], args["cache_path"], args["secure"])
+    if key not in _worker_clients:
+        _worker_clients[key] = MinioClient(endpoint=args["endpoint"],
+                                           access_key=args["access_key"],
+                                           secret_key=args["secret_key"],
+                                           cache_path=args["cache_path"],
+                                           secure=args["secure"])
+    return _worker_clients[key]
+
+
 def unwrap_load_object_cache(args):
-    mc = MinioClient(endpoint=args["endpoint"],
-                     access_key=args["access_key"],
-                     secret_key=args["secret_key"],
-                     cache_path=args["cache_path"])
-    
+    mc = get_worker_client(args)
     return mc._load_object_cache(path=args["file_path"],
                                  refresh=args["refresh"],
                                  file_format=args["file_format"])
     
 def unwrap_get_object_cache(args):
-    mc = MinioClient(endpoint=args["endpoint"],
-                     access_key=args["access_key"],
-                     secret_key=args["secret_key"],
-                     cache_path=args["cache_path"])
+    mc = get_worker_client(args)
     return mc._get_object_cache(path=args["file_path"],
                                  refresh=args["refresh"])
 
@@ -71,8 +85,13 @@ class MinioClient:
                  secret_key=None,
                  cache_path=None,
                  secure=False,
+                 processes=None,
                  **kwargs):
-        
+        """
+        processes sets the concurrency of batch operations, os.cpu_count() by default.
+        The minio client is created on first use and shared by all threads.
+        """
+
         self.endpoint = endpoint
         self.access_key = access_key
         self.secret_key = secret_key
@@ -86,12 +105,54 @@ class MinioClient:
         if cache_path is None:
             self.cache_path = os.environ.get("EASY_MINIO_CACHE")
         assert self.cache_path is not None
-        pathlib.Path(self.cache_path).mkdir(parents=True, exist_ok=True)
-        self._client = Minio(self.endpoint,
-                             access_key=self.access_key,
-                             secret_key=self.secret_key,
-                             secure=secure,
-                             **kwargs)
+        self.secure = secure
+        self.processes = processes
+        self._client_kwargs = kwargs
+        self._minio = None
+        self._minio_lock = threading.Lock()
+
+    @property
+    def _client(self):
+        if self._minio is None:
+            with self._minio_lock:
+                if self._minio is None:
+                    from minio import Minio
+                    kwargs = dict(self._client_kwargs)
+                    if kwargs.get("http_client") is None:
+                        kwargs["http_client"] = self._make_http_client(
+                            cert_check=kwargs.get("cert_check", True))
+                    self._minio = Minio(self.endpoint,
+                                        access_key=self.access_key,
+                                        secret_key=self.secret_key,
+                                        secure=self.secure,
+                                        **kwargs)
+        return self._minio
+
+    def _make_http_client(self, cert_check=True):
+        # Mirrors the default http client of minio 7.2.x (Minio.__init__), except that maxsize follows
+        # the number of threads used by batch operations so that no connection is discarded.
+        # Check it against minio when upgrading.
+        import certifi
+        import urllib3
+        timeout = 300
+        return urllib3.PoolManager(
+            timeout=urllib3.Timeout(connect=timeout, read=timeout),
+            maxsize=max(10, self._num_workers()),
+            cert_reqs="CERT_REQUIRED" if cert_check else "CERT_NONE",
+            ca_certs=os.environ.get("SSL_CERT_FILE") or certifi.where(),
+            retries=urllib3.Retry(
+                total=5,
+                backoff_factor=0.2,
+                status_forcelist=[500, 502, 503, 504]))
+
+    def _num_workers(self, processes=None):
+        num_workers = self.processes
+        if num_workers is None:
+            num_workers = os.cpu_count() or 1
+        # Threads share the connection pool of self._client, which is sized by self.processes.
+        if processes is not None:
+            num_workers = min(processes, num_workers)
+        return num_workers
 
     def get_object_cache(self,
                          path,
@@ -109,11 +170,13 @@ class MinioClient:
                     "access_key": self.access_key,
                     "secret_key": self.secret_key,
                     "cache_path": self.cache_path,
+                    "secure": self.secure,
                     "file_path": p,
                     "refresh": refresh,
                 }
                 queries.append(query)
-            with Pool() as pool:
+            from multiprocessing import Pool
+            with Pool(processes=self._num_workers()) as pool:
                 cache_paths = pool.map(unwrap_get_object_cache, queries)
             # errors = list(filter(lambda x: isinstance(x, Exception), cache_paths))
             # if len(errors) > 0:
@@ -168,13 +231,15 @@ class MinioClient:
                     "access_key": self.access_key,
                     "secret_key": self.secret_key,
                     "cache_path": self.cache_path,
+                    "secure": self.secure,
                     "file_path": p,
                     "refresh": refresh,
                     "file_format": file_format
                 }
                 queries.append(query)
                 
-            with Pool() as pool:
+            from multiprocessing import Pool
+            with Pool(processes=self._num_workers()) as pool:
             # with ThreadPool(processes=64) as pool:
                 objs = pool.map(unwrap_load_object_cache, queries)
                 
@@ -204,6 +269,7 @@ class MinioClient:
         if isinstance(object_cache_path, Exception):
             return object_cache_path
         if file_format == "pickle":
+            import pickle
             with open(object_cache_path, "rb") as f:
                 return pickle.load(f)
         else:
@@ -225,6 +291,7 @@ class MinioClient:
         if cache_file_path.is_file():
             os.remove(str(cache_file_path))
         if file_format == "pickle":
+            import pickle
             with open(cache_file_path, "wb") as f:
                 pickle.dump(obj, f)
         else:
@@ -248,6 +315,157 @@ class MinioClient:
             else:
                 raise e
 
+    def copy(self, src, dst, processes=None):
+        """
+        Server-side copy, object data is not transferred through the client.
+        src can be a path, an iterable of paths or a prefix ending with "/".
+        If src is a prefix or an iterable and dst is a path, dst is used as the target prefix.
+        Returns a list of target paths, failed items are replaced by the exception.
+        processes is capped by the processes given to the constructor, which sizes the connection pool.
+        """
+        pairs = self._expand_src_dst(src, dst)
+        from multiprocessing.pool import ThreadPool
+        with ThreadPool(processes=self._num_workers(processes)) as pool:
+            return pool.map(lambda pair: self._copy_object(*pair), pairs)
+
+    def move(self, src, dst, processes=None):
+        """
+        Same as copy, the sources are removed after being copied successfully.
+        """
+        pairs = self._expand_src_dst(src, dst)
+        from multiprocessing.pool import ThreadPool
+        with ThreadPool(processes=self._num_workers(processes)) as pool:
+            results = pool.map(lambda pair: self._copy_object(*pair, move=True), pairs)
+        copied = [src_path for (src_path, dst_path), res in zip(pairs, results)
+                  if not isinstance(res, Exception) and src_path != dst_path]
+        removed = dict(zip(copied, self._remove_objects(copied, processes=processes)))
+        for i, (src_path, _) in enumerate(pairs):
+            if isinstance(removed.get(src_path), Exception):
+                results[i] = removed[src_path]
+        return results
+
+    def remove(self, path, processes=None):
+        """
+        Remove objects with the multi-object delete API.
+        path can be a path, an iterable of paths or a prefix ending with "/".
+        Returns a list of removed paths, failed items are replaced by the exception.
+        processes is capped by the processes given to the constructor, which sizes the connection pool.
+        """
+        if is_path(path) and str(path).endswith("/"):
+            paths = self.list_objects(path, as_dir=True)
+        elif is_path(path):
+            paths = [str(path).strip("/")]
+        elif isinstance(path, Iterable):
+            paths = [str(p).strip("/") for p in path]
+        else:
+            raise ValueError()
+        return self._remove_objects(paths, processes=processes)
+
+    def _cache_file_path(self, path):
+        return pathlib.Path(self.cache_path) / str(path).strip("/")
+
+    def _expand_src_dst(self, src, dst):
+        if is_path(src) and str(src).endswith("/"):
+            if not is_path(dst):
+                raise ValueError("dst should be a path when src is a prefix")
+            src = str(src).strip("/")
+            dst = str(dst).strip("/")
+            pairs = [(p, dst + p[len(src):]) for p in self.list_objects(src, as_dir=True)]
+        elif is_path(src):
+            if not is_path(dst):
+                raise ValueError("dst should be a path when src is a path")
+            pairs = [(str(src).strip("/"), str(dst).strip("/"))]
+        elif isinstance(src, Iterable):
+            src = [str(p).strip("/") for p in src]
+            if is_path(dst):
+                dst = str(dst).strip("/")
+                pairs = [(p, "/".join([dst, p.split("/")[-1]])) for p in src]
+            else:
+                dst = [str(p).strip("/") for p in dst]
+                if len(src) != len(dst):
+                    raise ValueError(
+                        "src and dst have different lengths {} and {}".format(len(src), len(dst)))
+                pairs = list(zip(src, dst))
+        else:
+            raise ValueError()
+        # Pairs are copied concurrently and the sources are removed by move, so a target must not
+        # be the source of another pair, nor the target of another pair.
+        sources = set(src_path for src_path, _ in pairs)
+        targets = set()
+        for src_path, dst_path in pairs:
+            if dst_path != src_path and dst_path in sources:
+                raise ValueError("{} is both a source and a target".format(dst_path))
+            if dst_path in targets:
+                raise ValueError("{} is the target of more than one source".format(dst_path))
+            targets.add(dst_path)
+        return pairs
+
+    def _copy_object(self, src, dst, move=False):
+        src_bucket, src_prefix = get_bucket_and_prefix(src)
+        dst_bucket, dst_prefix = get_bucket_and_prefix(dst)
+        from minio.commonconfig import CopySource
+        try:
+            # minio switches to compose_object for sources larger than 5GiB.
+            self._client.copy_object(dst_bucket, dst_prefix,
+                                     CopySource(src_bucket, src_prefix))
+        except Exception as e:
+            return e
+        src_cache_file_path = self._cache_file_path(src)
+        dst_cache_file_path = self._cache_file_path(dst)
+        try:
+            if src_cache_file_path.is_file():
+                if move:
+                    move_file(src_cache_file_path, dst_cache_file_path)
+                else:
+                    link_or_copy_file(src_cache_file_path, dst_cache_file_path)
+            elif dst_cache_file_path.is_file():
+                os.remove(str(dst_cache_file_path))
+        except OSError:
+            # The cache is best effort, e.g. the cache path of dst may be a directory when objects
+            # "a/b" and "a/b/c" both exist. A stale cached file must not be left behind though.
+            try:
+                if dst_cache_file_path.is_file():
+                    os.remove(str(dst_cache_file_path))
+            except OSError:
+                pass
+        return dst
+
+    def _remove_objects(self, paths, processes=None):
+        batches = {}
+        for p in paths:
+            bucket, prefix = get_bucket_and_prefix(p)
+            batches.setdefault(bucket, []).append(prefix)
+        queries = []
+        for bucket, prefixes in batches.items():
+            for i in range(0, len(prefixes), MAX_DELETE_OBJECTS):
+                queries.append((bucket, prefixes[i:i + MAX_DELETE_OBJECTS]))
+        from multiprocessing.pool import ThreadPool
+        with ThreadPool(processes=self._num_workers(processes)) as pool:
+            errors = {}
+            for res in pool.map(lambda query: self._remove_batch(*query), queries):
+                errors.update(res)
+        results = []
+        for p in paths:
+            if p in errors:
+                results.append(errors[p])
+                continue
+            cache_file_path = self._cache_file_path(p)
+            if cache_file_path.is_file():
+                os.remove(str(cache_file_path))
+            results.append(p)
+        return results
+
+    def _remove_batch(self, bucket, prefixes):
+        from minio.deleteobjects import DeleteObject
+        try:
+            errors = {}
+            for err in self._client.remove_objects(bucket, [DeleteObject(p) for p in prefixes]):
+                errors["/".join([bucket, err.name])] = IOError(
+                    "Failed to remove object {}: {} {}".format(err.name, err.code, err.message))
+            return errors
+        except Exception as e:
+            return {"/".join([bucket, p]): e for p in prefixes}
+
     def open(self, file_path, mode="r", refresh=True):
         return Open(self, file_path, mode=mode, refresh=refresh, version_id=None)
 
@@ -260,8 +478,13 @@ class MinioClient:
         else:
             self._client.make_bucket(bucket)
 
-    def list_objects(self, path, recursive=True, verbose=False):
-        bucket, prefix = get_bucket_and_prefix(path)
+    def list_objects(self, path, recursive=True, verbose=False, as_dir=False):
+        """
+        If as_dir is True, path is listed as a directory, e.g. "bucket/a" does not match "bucket/ab".
+        """
+        bucket, prefix = get_bucket_and_prefix(str(path))
+        if as_dir and prefix:
+            prefix += "/"
         objs = []
         if verbose:
             print(
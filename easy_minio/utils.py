@@ -1,4 +1,6 @@
+import os
 import pathlib
+import shutil
 
 
 def infer_format(path):
@@ -29,4 +31,28 @@ def is_path(o):
     return isinstance(o, (str, 
                           pathlib.Path, 
                           pathlib.PurePosixPath, 
-                          pathlib.PosixPath))
\ No newline at end of file
+                          pathlib.PosixPath))
+
+
+def link_or_copy_file(src, dst):
+    create_parent_folder_if_not_exists(dst)
+    if os.path.isfile(str(dst)):
+        os.remove(str(dst))
+    try:
+        os.link(str(src), str(dst))
+    except OSError:
+        shutil.copy2(str(src), str(dst))
+
+
+def move_file(src, dst):
+    create_parent_folder_if_not_exists(dst)
+    os.replace(str(src), str(dst))
+
+
+def break_hardlink(path):
+    # Cached files may be hardlinked by copy(), writing in place would modify all of them.
+    path = str(path)
+    if os.path.isfile(path) and os.stat(path).st_nlink > 1:
+        tmp_path = path + ".easy_minio_tmp"
+        shutil.copy2(path, tmp_path)
+        os.replace(tmp_path, path)
@@ -0,0 +1,45 @@
+"""
+Reports the time of `import easy_minio` and the latency of the first calls of a new MinioClient.
+The minio server is configured by the same environment variables as the tests.
+
+    python -m tests.benchmark_startup [object_path]
+"""
+import pathlib
+import subprocess
+import sys
+import time
+
+repeat = 10
+
+
+def import_time():
+    code = ("import time\n"
+            "t = time.perf_counter()\n"
+            "import easy_minio\n"
+            "print(time.perf_counter() - t)\n")
+    times = []
+    for _ in range(repeat):
+        out = subprocess.check_output([sys.executable, "-c", code],
+                                      cwd=str(pathlib.Path(__file__).parent.parent))
+        times.append(float(out.decode()))
+    return min(times)
+
+
+def first_call_time(object_path):
+    from easy_minio import MinioClient
+    t1 = time.perf_counter()
+    mc = MinioClient()
+    t2 = time.perf_counter()
+    mc.object_exists(object_path)
+    t3 = time.perf_counter()
+    mc.object_exists(object_path)
+    t4 = time.perf_counter()
+    return t2 - t1, t3 - t2, t4 - t3
+
+
+if __name__ == "__main__":
+    object_path = sys.argv[1] if len(sys.argv) > 1 else "easy-minio-test/text_test.pkl"
+    print("import time {:.2f}ms (best of {})".format(import_time() * 1000, repeat))
+    construct, first_call, second_call = first_call_time(object_path)
+    print("construct time {:.2f}ms, first call time {:.2f}ms, second call time {:.2f}ms".format(
+        construct * 1000, first_call * 1000, second_call * 1000))
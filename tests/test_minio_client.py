@@ -1,5 +1,7 @@
 import pathlib
 import pickle
+import subprocess
+import sys
 import time
 
 import numpy as np
@@ -150,4 +152,135 @@ def test_load_multiple_objects_error():
     try:
         _ = mc.load_object_cache(paths, refresh=True)
     except Exception as e:
-        print("{}".format(e))
\ No newline at end of file
+        print("{}".format(e))
+
+def test_copy_object():
+    mc = MinioClient()
+    src_path = pathlib.PurePosixPath(
+        test_bucket_name) / "dump/dump_object.pkl"
+    dst_path = pathlib.PurePosixPath(
+        test_bucket_name) / "copy/dump_object.pkl"
+    res = mc.copy(src_path, dst_path)
+    assert res == [str(dst_path)]
+    assert mc.load_object_cache(dst_path, refresh=True) == test_object
+
+
+def test_copy_prefix():
+    mc = MinioClient()
+    res = mc.copy(test_bucket_name + "/dump/", test_bucket_name + "/copy_prefix")
+    assert res == [test_bucket_name + "/copy_prefix/dump_object.pkl"]
+    assert mc.object_exists(test_bucket_name + "/copy_prefix/dump_object.pkl")
+
+
+def test_move_objects():
+    mc = MinioClient()
+    src_path = pathlib.PurePosixPath(
+        test_bucket_name) / "copy/dump_object.pkl"
+    res = mc.move([src_path], test_bucket_name + "/move")
+    assert res == [test_bucket_name + "/move/dump_object.pkl"]
+    assert mc.object_exists(src_path) == False
+    assert mc.load_object_cache(res[0]) == test_object
+
+
+def test_remove_objects():
+    mc = MinioClient()
+    file_path = test_bucket_name + "/move/dump_object.pkl"
+    res = mc.remove([file_path])
+    assert res == [file_path]
+    assert mc.object_exists(file_path) == False
+    res = mc.remove(test_bucket_name + "/copy_prefix/")
+    assert res == [test_bucket_name + "/copy_prefix/dump_object.pkl"]
+
+
+def test_lazy_import():
+    code = ("import sys\n"
+            "import easy_minio\n"
+            "print(' '.join(m for m in ['minio', 'multiprocessing', 'pickle'] if m in sys.modules))\n")
+    out = subprocess.check_output([sys.executable, "-c", code],
+                                  cwd=str(pathlib.Path(__file__).parent.parent)).decode().split()
+    assert out == []
+
+
+def test_lazy_client():
+    mc = MinioClient()
+    assert mc._minio is None
+    mc.object_exists(pathlib.PurePosixPath(test_bucket_name) / "text_test.pkl")
+    assert mc._minio is not None
+
+
+def test_move_prefix_into_subdirectory():
+    mc = MinioClient()
+    mc.dump_object_cache("outer", test_bucket_name + "/nested/x.pkl")
+    mc.dump_object_cache("inner", test_bucket_name + "/nested/sub/x.pkl")
+    try:
+        mc.move(test_bucket_name + "/nested/", test_bucket_name + "/nested/sub")
+        assert False
+    except ValueError:
+        pass
+    assert mc.load_object_cache(test_bucket_name + "/nested/x.pkl", refresh=True) == "outer"
+    assert mc.load_object_cache(test_bucket_name + "/nested/sub/x.pkl", refresh=True) == "inner"
+    mc.remove(test_bucket_name + "/nested/")
+
+
+def test_copy_target_is_source():
+    mc = MinioClient()
+    src_paths = [test_bucket_name + "/chain/a.pkl", test_bucket_name + "/chain/b.pkl"]
+    dst_paths = [test_bucket_name + "/chain/b.pkl", test_bucket_name + "/chain/c.pkl"]
+    try:
+        mc.copy(src_paths, dst_paths)
+        assert False
+    except ValueError:
+        pass
+
+
+def test_move_duplicate_targets():
+    mc = MinioClient()
+    src_paths = [test_bucket_name + "/dup/x/f.pkl", test_bucket_name + "/dup/y/f.pkl"]
+    try:
+        mc.move(src_paths, test_bucket_name + "/dup/z")
+        assert False
+    except ValueError:
+        pass
+
+
+def test_copy_move_cache_consistency():
+    mc = MinioClient()
+    src_path = test_bucket_name + "/cache/src.txt"
+    dst_path = test_bucket_name + "/cache/dst.txt"
+    with mc.open(src_path, "w") as f:
+        f.write("source")
+    src_cache_file_path = mc._cache_file_path(src_path)
+    dst_cache_file_path = mc._cache_file_path(dst_path)
+
+    mc.copy(src_path, dst_path)
+    assert src_cache_file_path.samefile(dst_cache_file_path)
+    with mc.open(dst_path, "w") as f:
+        f.write("target")
+    assert src_cache_file_path.read_text() == "source"
+    assert dst_cache_file_path.read_text() == "target"
+
+    mc.copy(src_path, dst_path)
+    with mc.open(dst_path, "a", refresh=False) as f:
+        f.write(" appended")
+    assert src_cache_file_path.read_text() == "source"
+    assert dst_cache_file_path.read_text() == "source appended"
+
+    moved_path = test_bucket_name + "/cache/moved.txt"
+    mc.move(src_path, moved_path)
+    assert not src_cache_file_path.exists()
+    assert mc._cache_file_path(moved_path).read_text() == "source"
+    mc.remove(test_bucket_name + "/cache/")
+
+
+def test_copy_cache_error():
+    mc = MinioClient()
+    src_path = test_bucket_name + "/cache_error/src.pkl"
+    dst_path = test_bucket_name + "/cache_error/dst"
+    mc.dump_object_cache(test_object, src_path)
+    # The cache path of dst is a directory.
+    mc.dump_object_cache(test_object, dst_path + "/inner.pkl")
+    res = mc.move([src_path], [dst_path])
+    assert res == [dst_path]
+    assert mc.object_exists(src_path) == False
+    assert mc.object_exists(dst_path)
+    mc.remove(test_bucket_name + "/cache_error/")